@@ -1,215 +1,431 @@
 import pandas as pd
+import polars as pl
 import numpy as np
 import os
+import argparse
 from datetime import datetime
+from functools import lru_cache
 import logging
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import matplotlib
+matplotlib.use('Agg')  # Render straight to PNG without importing a GUI toolkit
 import matplotlib.pyplot as plt
+from matplotlib.ticker import MaxNLocator
+from PIL import Image, ImageDraw, ImageFont
 from scipy.optimize import curve_fit
-import gc
 
-def setup_logging():
-    """Set up logging to console only."""
+# Bump whenever load_data changes what it caches, so Parquet files written by older code are rebuilt
+CACHE_VERSION = 1
+
+def setup_logging(verbose=False):
+    """Set up logging to console only; verbose enables the DEBUG-level dataset diagnostics."""
     logging.basicConfig(
-        level=logging.INFO,
+        level=logging.DEBUG if verbose else logging.INFO,
         format='%(asctime)s - %(levelname)s - %(message)s',
         handlers=[logging.StreamHandler()]
     )
+    logging.getLogger('matplotlib').setLevel(logging.INFO)  # Keep font-matching chatter out of --verbose
 
 def load_data(file_path):
     """Load CSV file into a pandas DataFrame with optimized settings."""
     usecols = ['State', 'Model Year', 'Make', 'Model', 'County', 'City', 'Electric Vehicle Type', 'Electric Range']
-    dtypes = {
-        'State': 'category',
-        'Model Year': 'int16',
-        'Make': 'category',
-        'Model': 'category',
-        'County': 'category',
-        'City': 'category',
-        'Electric Vehicle Type': 'category',
-        'Electric Range': 'float32'
+    schema = {
+        'State': pl.Categorical,
+        'Model Year': pl.Int16,
+        'Make': pl.Categorical,
+        'Model': pl.Categorical,
+        'County': pl.Categorical,
+        'City': pl.Categorical,
+        'Electric Vehicle Type': pl.Categorical,
+        'Electric Range': pl.Float32
     }
+    cache_path = os.path.splitext(file_path)[0] + '.parquet'
+    # Row and missing-value diagnostics describe the raw CSV, which the filtered cache cannot answer
+    debug = logging.getLogger().isEnabledFor(logging.DEBUG)
     try:
-        df = pd.read_csv(file_path, usecols=usecols, dtype=dtypes)
-        logging.info(f"Loaded data from {file_path} with {len(df)} rows and {len(df.columns)} columns")
-        print("Dataset Preview:")
-        print(df.head())
-        print("\nDataset Info:")
-        df.info()
-        print("\nMissing Values:")
-        print(df.isnull().sum())
-        df = df.dropna().reset_index(drop=True)
-        logging.info(f"Dropped missing values, remaining rows: {len(df)}")
-        df = df[df['State'] == 'WA'].reset_index(drop=True)
-        logging.info(f"Filtered data for WA state: {len(df)} rows")
+        # Reuse the filtered Parquet cache from a previous run unless the CSV has changed since,
+        # or the diagnostics were requested (they need a fresh scan of the CSV)
+        if not debug and os.path.exists(cache_path) and os.path.getmtime(cache_path) > os.path.getmtime(file_path):
+            try:
+                df = pd.read_parquet(cache_path, engine='pyarrow')
+                if df.attrs.get('cache_version') == CACHE_VERSION:
+                    logging.info(f"Loaded cached data from {cache_path} with {len(df)} rows")
+                    return df
+                logging.info(f"Cache file {cache_path} was written by an older version; rebuilding it")
+            except Exception as e:
+                # A truncated or corrupt cache must not stop the run; drop it and fall back to the CSV
+                logging.warning(f"Ignoring unreadable cache file {cache_path}: {e}")
+                try:
+                    os.remove(cache_path)
+                except OSError:
+                    pass
+        # Lazy scan: projection, null handling and the WA filter run as one multi-threaded pass
+        lf = pl.scan_csv(file_path, schema_overrides=schema).select(usecols)
+        # One combined mask instead of separate drop_nulls and State filters, so rows are copied once
+        complete = pl.all_horizontal(pl.all().is_not_null())
+        filtered = lf.filter(complete & (pl.col('State') == 'WA')).drop('State')
+        # Row and missing-value diagnostics cost a full extra pass, so only run them when debugging
+        queries = [filtered]
+        if debug:
+            queries.append(lf.select(
+                pl.len().alias('total_rows'),
+                complete.sum().alias('complete_rows'),
+                pl.all().null_count()
+            ))
+            queries.append(lf.head(5))
+        results = pl.collect_all(queries)
+        # Convert at the boundary so downstream pandas/matplotlib code is unchanged
+        df = results[0].to_pandas()
+        # The WA filter can leave national-level values in the category dictionaries; drop them once here
+        for col in ['Make', 'Model', 'County', 'City', 'Electric Vehicle Type']:
+            df[col] = df[col].cat.remove_unused_categories()
+        if debug:
+            # Every diagnostic here describes the raw CSV columns, before the null and WA filters
+            stats = results[1].row(0, named=True)
+            logging.debug(f"Read {stats['total_rows']} rows and {len(usecols)} columns from {file_path}")
+            print("Dataset Preview:")
+            print(results[2].to_pandas())
+            print("\nDataset Info:")
+            print(f"{stats['total_rows']} rows, {len(usecols)} columns")
+            print(pd.Series({col: str(dtype) for col, dtype in lf.collect_schema().items()}))
+            print("\nMissing Values:")
+            print(pd.Series({col: stats[col] for col in usecols}))
+            logging.debug(f"Dropped missing values, remaining rows: {stats['complete_rows']}")
+        logging.info(f"Loaded data from {file_path} and filtered for WA state: {len(df)} rows")
+        # Write to a temporary file and swap it in, so an interrupted write never leaves a partial cache
+        tmp_path = os.path.splitext(file_path)[0] + f'.{os.getpid()}.tmp.parquet'
+        try:
+            df.attrs['cache_version'] = CACHE_VERSION
+            df.to_parquet(tmp_path, engine='pyarrow', compression='zstd')
+            os.replace(tmp_path, cache_path)
+            logging.info(f"Cached filtered data to {cache_path}")
+        except Exception as e:
+            logging.warning(f"Could not write cache file: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
         return df
     except Exception as e:
         logging.error(f"Error loading file: {e}")
         return None
 
-def plot_all_charts(df, forecasted_evs, output_prefix):
-    """Plot charts with matplotlib styling, optimizing memory and time."""
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+def encode_model_years(df):
+    """Encode Model Year as non-negative offsets from the earliest year for bincount."""
+    years_arr = df['Model Year'].to_numpy()
+    min_year = int(years_arr.min())
+    year_codes = years_arr.astype(np.intp) - min_year
+    return year_codes, min_year
 
-    # Precompute aggregations to reuse
-    ev_adoption_by_year = df['Model Year'].value_counts().sort_index()
-    ev_county_distribution = df['County'].value_counts()
-    top_counties = ev_county_distribution.head(3).index
-    top_counties_data = df[df['County'].isin(top_counties)]
-    ev_type_distribution = df['Electric Vehicle Type'].value_counts()
-    ev_make_distribution = df['Make'].value_counts().head(5)
-    top_3_makes = ev_make_distribution.head(3).index
-    top_makes_data = df[df['Make'].isin(top_3_makes)]
-
-    # EV Adoption Over Time
-    fig, ax = plt.subplots(figsize=(8, 4))
-    years = ev_adoption_by_year.index.astype(int)
-    ax.bar(years, ev_adoption_by_year.values, color=plt.cm.viridis(np.linspace(0, 1, len(years))))
-    ax.set_title('EV Adoption Over Time')
-    ax.set_xlabel('Model Year')
-    ax.set_ylabel('Number of Vehicles')
-    plt.xticks(rotation=45)
-    plt.subplots_adjust(bottom=0.2)  # Add padding for rotated x-axis labels
-    filename = f'{output_prefix}_ev_adoption_over_time_{timestamp}.png'
-    plt.savefig(filename, dpi=150, bbox_inches='tight')
-    plt.close(fig)
-    gc.collect()
-    logging.info(f"Saved EV adoption over time plot")
-
-    # Top Cities in Top Counties
-    fig, ax = plt.subplots(figsize=(8, 6))
-    ev_city_distribution_top_counties = top_counties_data.groupby(['County', 'City'], observed=True).size().sort_values(ascending=False).head(5).reset_index(name='Number of Vehicles')
-    ev_city_distribution_top_counties['City'] = ev_city_distribution_top_counties['City'].astype(str).apply(lambda x: x[:12] + '...' if len(x) > 12 else x)
-    colors = plt.cm.magma(np.linspace(0, 1, len(top_counties)))
-    for i, county in enumerate(ev_city_distribution_top_counties['County'].unique()):
-        subset = ev_city_distribution_top_counties[ev_city_distribution_top_counties['County'] == county]
-        ax.barh(subset['City'], subset['Number of Vehicles'], color=colors[i], label=county)
-    ax.set_title('Top Cities in Top Counties by EV Registrations')
-    ax.set_xlabel('Number of Vehicles')
-    ax.set_ylabel('City')
-    ax.legend(title='County', loc='upper right')  # Legend inside, top-right
-    filename = f'{output_prefix}_top_cities_in_top_counties_{timestamp}.png'
-    plt.savefig(filename, dpi=150, bbox_inches='tight')
-    plt.close(fig)
-    gc.collect()
-    logging.info(f"Saved top cities in top counties plot")
-
-    # EV Type Distribution
-    fig, ax = plt.subplots(figsize=(6, 4))
-    ax.barh(ev_type_distribution.index, ev_type_distribution.values, color=plt.cm.magma(np.linspace(0, 1, len(ev_type_distribution))))
-    ax.set_title('Distribution of Electric Vehicle Types')
-    ax.set_xlabel('Number of Vehicles')
-    ax.set_ylabel('Electric Vehicle Type')
-    filename = f'{output_prefix}_ev_type_distribution_{timestamp}.png'
-    plt.savefig(filename, dpi=150, bbox_inches='tight')
-    plt.close(fig)
-    gc.collect()
-    logging.info(f"Saved EV type distribution plot")
-
-    # Top 5 Makes
-    fig, ax = plt.subplots(figsize=(8, 4))
-    ax.barh(ev_make_distribution.index, ev_make_distribution.values, color=plt.cm.cubehelix(np.linspace(0, 1, len(ev_make_distribution))))
-    ax.set_title('Top 5 Popular EV Makes')
-    ax.set_xlabel('Number of Vehicles')
-    ax.set_ylabel('Make')
-    filename = f'{output_prefix}_top_5_makes_{timestamp}.png'
-    plt.savefig(filename, dpi=150, bbox_inches='tight')
-    plt.close(fig)
-    gc.collect()
-    logging.info(f"Saved top 5 makes plot")
-
-    # Top Models in Top 3 Makes
-    fig, ax = plt.subplots(figsize=(8, 6))
-    ev_model_distribution_top_makes = top_makes_data.groupby(['Make', 'Model'], observed=True).size().sort_values(ascending=False).reset_index(name='Number of Vehicles')
-    top_models = ev_model_distribution_top_makes.head(5).copy()
-    top_models['Model'] = top_models['Model'].astype(str).apply(lambda x: x[:12] + '...' if len(x) > 12 else x)
-    colors = plt.cm.viridis(np.linspace(0, 1, len(top_3_makes)))
-    for i, make in enumerate(top_models['Make'].unique()):
-        subset = top_models[top_models['Make'] == make]
-        ax.barh(subset['Model'], subset['Number of Vehicles'], color=colors[i], label=make)
-    ax.set_title('Top Models in Top 3 Makes by EV Registrations')
-    ax.set_xlabel('Number of Vehicles')
-    ax.set_ylabel('Model')
-    ax.legend(title='Make', loc='upper right')  # Legend inside, top-right
-    filename = f'{output_prefix}_top_models_in_top_makes_{timestamp}.png'
-    plt.savefig(filename, dpi=150, bbox_inches='tight')
-    plt.close(fig)
-    gc.collect()
-    logging.info(f"Saved top models in top makes plot")
-
-    # Average Range by Model Year
-    fig, ax = plt.subplots(figsize=(8, 4))
-    average_range_by_year = df.groupby('Model Year')['Electric Range'].mean().reset_index()
-    ax.plot(average_range_by_year['Model Year'], average_range_by_year['Electric Range'], marker='o', color='green')
+def aggregate_by_year(year_codes, min_year, ranges):
+    """Count registrations and average electric range per model year in one bincount pass."""
+    counts = np.bincount(year_codes)
+    sums = np.bincount(year_codes, weights=ranges)
+    # Sums stay float64 for accuracy; the per-year means go downstream as float32 like the source column
+    means = (sums / np.maximum(counts, 1)).astype(np.float32)
+    # Skip model years with no registrations, matching value_counts/groupby output
+    present = np.flatnonzero(counts)
+    return present + min_year, counts[present], means[present]
+
+def truncate12(s):
+    """Shorten labels longer than 12 characters to 12 characters plus '...'."""
+    s = s.astype(str)
+    return np.where(s.str.len().to_numpy() > 12, (s.str.slice(0, 12) + '...').to_numpy(), s.to_numpy())
+
+def top_k(values, k):
+    """Return the indices of the k largest values, largest first."""
+    k = min(k, values.size)
+    # argpartition finds the top k in O(n); only those k entries are then sorted
+    top_idx = np.argpartition(values, -k)[-k:]
+    return top_idx[np.argsort(-values[top_idx], kind='stable')]
+
+def top_k_categories(s, k):
+    """Return the codes and counts of the k most frequent categories of s, most frequent first."""
+    counts = np.bincount(s.cat.codes.to_numpy(), minlength=len(s.cat.categories))
+    top_codes = top_k(counts, k)
+    return top_codes, counts[top_codes]
+
+def pair_stats(first, second, weights=None):
+    """Return the codes, row counts and optional weight sums of each observed category pair via one flat bincount."""
+    n_second = len(second.cat.categories)
+    flat = first.cat.codes.to_numpy().astype(np.int64) * n_second + second.cat.codes.to_numpy()
+    size = len(first.cat.categories) * n_second
+    counts = np.bincount(flat, minlength=size)
+    present = np.flatnonzero(counts)
+    sums = None if weights is None else np.bincount(flat, weights=weights, minlength=size)[present]
+    return present // n_second, present % n_second, counts[present], sums
+
+def rows_with_codes(s, codes):
+    """Return a boolean row mask selecting rows whose category code of s is in codes."""
+    # A lookup table indexed by code turns membership into one small-integer gather
+    lookup = np.zeros(len(s.cat.categories), dtype=bool)
+    lookup[codes] = True
+    return lookup[s.cat.codes.to_numpy()]
+
+@lru_cache(maxsize=32)
+def _cmap(name, n):
+    """Return n evenly spaced colors from the named colormap, memoized across charts."""
+    return matplotlib.colormaps[name](np.linspace(0, 1, n))
+
+# Each worker process keeps one figure and reuses its canvas for every matplotlib chart it renders
+_figure = None
+
+def _reset_axes(width, height):
+    """Return this process's reusable figure and axes, cleared and resized for the next chart."""
+    global _figure
+    if _figure is None:
+        _figure, _ = plt.subplots()
+    ax = _figure.axes[0]
+    ax.clear()
+    ax.tick_params(axis='x', labelrotation=0)  # ax.clear() keeps the tick rotation
+    _figure.set_size_inches(width, height)
+    return _figure, ax
+
+def _save_chart(fig, filename):
+    """Lay out the chart once and write it to disk."""
+    fig.tight_layout()  # Fixed layout; avoids the second render pass of bbox_inches='tight'
+    fig.savefig(filename, dpi=100)
+
+# matplotlib ships DejaVu Sans, so the Pillow charts match its typography without a system font lookup
+_FONT_PATH = os.path.join(matplotlib.get_data_path(), 'fonts', 'ttf', 'DejaVuSans.ttf')
+
+@lru_cache(maxsize=8)
+def _font(size):
+    """Return the chart font at the given pixel size, loaded once per process."""
+    return ImageFont.truetype(_FONT_PATH, size)
+
+def _rgb(color):
+    """Convert a matplotlib RGBA float color to an 8-bit RGB tuple for Pillow."""
+    return tuple(int(round(255 * c)) for c in color[:3])
+
+def _draw_rotated_text(img, xy, text, font, angle, anchor='mm'):
+    """Paste text rotated counter-clockwise by angle degrees, centred on xy or with its top-right corner at xy."""
+    left, top, right, bottom = font.getbbox(text)
+    layer = Image.new('RGBA', (right - left, bottom - top), (255, 255, 255, 0))
+    ImageDraw.Draw(layer).text((-left, -top), text, font=font, fill='black')
+    layer = layer.rotate(angle, expand=True)
+    x, y = xy
+    if anchor == 'rt':
+        img.paste(layer, (int(x - layer.width), int(y)), layer)
+    else:
+        img.paste(layer, (int(x - layer.width / 2), int(y - layer.height / 2)), layer)
+
+def _value_ticks(vmax, vmin=0, integer=False):
+    """Return round tick values covering vmin..vmax, spaced the way matplotlib would choose them."""
+    ticks = MaxNLocator(nbins=8, integer=integer).tick_values(vmin, vmax)
+    return ticks[(ticks >= vmin) & (ticks <= vmax)]
+
+def _draw_frame(img, draw, box, title, xlabel, ylabel):
+    """Draw the plot border, title and axis labels around box = (left, top, right, bottom)."""
+    left, top, right, bottom = box
+    draw.rectangle(box, outline='black')
+    draw.text(((left + right) / 2, top - 12), title, font=_font(14), fill='black', anchor='ms')
+    if xlabel:
+        draw.text(((left + right) / 2, img.height - 10), xlabel, font=_font(12), fill='black', anchor='md')
+    if ylabel:
+        _draw_rotated_text(img, (14, (top + bottom) / 2), ylabel, _font(12), 90)
+
+def _draw_legend(draw, box, title, entries):
+    """Draw a legend of (label, color) entries in the top-right corner inside box."""
+    font = _font(11)
+    line = 18
+    width = max(draw.textlength(text, font=font) for text in [title] + [label for label, _ in entries]) + 36
+    right, top = box[2] - 8, box[1] + 8
+    left = right - width
+    draw.rectangle((left, top, right, top + line * (len(entries) + 1) + 6), fill='white', outline=(204, 204, 204))
+    draw.text(((left + right) / 2, top + 4), title, font=font, fill='black', anchor='mt')
+    for i, (label, color) in enumerate(entries, start=1):
+        y = top + 4 + line * i
+        draw.rectangle((left + 8, y + 2, left + 24, y + 12), fill=color)
+        draw.text((left + 30, y), label, font=font, fill='black')
+
+def render_barh(labels, values, colors, title, path, w=800, h=400, xlabel=None, ylabel=None, legend=None):
+    """Render a horizontal bar chart straight to PNG with Pillow, first bar at the bottom like matplotlib."""
+    img = Image.new('RGB', (w, h), 'white')
+    draw = ImageDraw.Draw(img)
+    font = _font(12)
+    labels = [str(label) for label in labels]
+    label_width = max(draw.textlength(label, font=font) for label in labels)
+    box = (int(label_width) + (40 if ylabel else 16), 40, w - 24, h - (50 if xlabel else 30))
+    left, top, right, bottom = box
+    xmax = max(float(np.max(values)), 1e-9) * 1.05
+    slot = (bottom - top) / len(labels)
+    for i, (label, value, color) in enumerate(zip(labels, values, colors)):
+        centre = bottom - slot * (i + 0.5)
+        draw.rectangle((left, centre - slot * 0.4, left + (right - left) * float(value) / xmax, centre + slot * 0.4), fill=color)
+        draw.text((left - 6, centre), label, font=font, fill='black', anchor='rm')
+    for tick in _value_ticks(xmax):
+        x = left + (right - left) * tick / xmax
+        draw.line((x, bottom, x, bottom + 4), fill='black')
+        draw.text((x, bottom + 6), f'{tick:g}', font=font, fill='black', anchor='mt')
+    _draw_frame(img, draw, box, title, xlabel, ylabel)
+    if legend:
+        _draw_legend(draw, box, *legend)
+    img.save(path, optimize=False)
+
+def render_bar(positions, values, colors, title, path, w=800, h=400, xlabel=None, ylabel=None):
+    """Render a vertical bar chart on a continuous integer x axis (e.g. years), so gaps stay visible."""
+    img = Image.new('RGB', (w, h), 'white')
+    draw = ImageDraw.Draw(img)
+    font = _font(12)
+    xmin, xmax = int(np.min(positions)), int(np.max(positions))
+    span = xmax - xmin + 1
+    ymax = max(float(np.max(values)), 1e-9) * 1.05
+    tick_width = max(draw.textlength(f'{tick:g}', font=font) for tick in _value_ticks(ymax))
+    box = (int(tick_width) + (40 if ylabel else 16), 40, w - 24, h - (80 if xlabel else 60))
+    left, top, right, bottom = box
+    slot = (right - left) / span
+    for position, value, color in zip(positions, values, colors):
+        bar_left = left + (right - left) * (int(position) - xmin) / span
+        draw.rectangle((bar_left + slot * 0.1, bottom - (bottom - top) * float(value) / ymax, bar_left + slot * 0.9, bottom), fill=color)
+    for tick in _value_ticks(xmax + 0.5, vmin=xmin - 0.5, integer=True):
+        x = left + (right - left) * (tick - xmin + 0.5) / span
+        draw.line((x, bottom, x, bottom + 4), fill='black')
+        _draw_rotated_text(img, (x + 4, bottom + 4), f'{tick:g}', font, 45, anchor='rt')
+    for tick in _value_ticks(ymax):
+        y = bottom - (bottom - top) * tick / ymax
+        draw.line((left - 4, y, left, y), fill='black')
+        draw.text((left - 6, y), f'{tick:g}', font=font, fill='black', anchor='rm')
+    _draw_frame(img, draw, box, title, xlabel, ylabel)
+    img.save(path, optimize=False)
+
+def _plot_ev_adoption(years, counts, filename):
+    colors = [_rgb(color) for color in _cmap('viridis', len(years))]
+    render_bar(years, counts, colors, 'EV Adoption Over Time', filename, xlabel='Model Year', ylabel='Number of Vehicles')
+
+def _plot_barh(labels, values, cmap, title, xlabel, ylabel, filename):
+    colors = [_rgb(color) for color in _cmap(cmap, len(labels))]
+    render_barh(labels, values, colors, title, filename, xlabel=xlabel, ylabel=ylabel)
+
+def _plot_grouped_barh(labels, values, groups, n_colors, cmap, title, xlabel, ylabel, legend_title, filename):
+    palette = [_rgb(color) for color in _cmap(cmap, n_colors)]
+    group_colors = dict(zip(dict.fromkeys(groups), palette))
+    # Keep each group's bars together in first-appearance order, as the per-group matplotlib barh calls did
+    order = np.concatenate([np.flatnonzero(groups == group) for group in group_colors])
+    render_barh(labels[order], values[order], [group_colors[group] for group in groups[order]], title, filename,
+                h=600, xlabel=xlabel, ylabel=ylabel, legend=(legend_title, list(group_colors.items())))
+
+def _plot_average_range(years, mean_range, filename):
+    fig, ax = _reset_axes(8, 4)
+    ax.plot(years, mean_range, marker='o', color='green')
     ax.set_title('Average Electric Range by Model Year')
     ax.set_xlabel('Model Year')
     ax.set_ylabel('Average Electric Range (miles)')
-    filename = f'{output_prefix}_average_range_by_year_{timestamp}.png'
-    plt.savefig(filename, dpi=150, bbox_inches='tight')
-    plt.close(fig)
-    gc.collect()
-    logging.info(f"Saved average range by year plot")
-
-    # Top Models by Average Range
-    fig, ax = plt.subplots(figsize=(8, 6))
-    average_range_by_model = top_makes_data.groupby(['Make', 'Model'], observed=True)['Electric Range'].mean().sort_values(ascending=False).reset_index()
-    top_range_models = average_range_by_model.head(5).copy()
-    top_range_models['Model'] = top_range_models['Model'].astype(str).apply(lambda x: x[:12] + '...' if len(x) > 12 else x)
-    colors = plt.cm.cool(np.linspace(0, 1, len(top_3_makes)))
-    for i, make in enumerate(top_range_models['Make'].unique()):
-        subset = top_range_models[top_range_models['Make'] == make]
-        ax.barh(subset['Model'], subset['Electric Range'], color=colors[i], label=make)
-    ax.set_title('Top 5 Models by Average Range in Top Makes')
-    ax.set_xlabel('Average Electric Range (miles)')
-    ax.set_ylabel('Model')
-    ax.legend(title='Make', loc='upper right')  # Legend inside, top-right
-    filename = f'{output_prefix}_top_models_by_range_{timestamp}.png'
-    plt.savefig(filename, dpi=150, bbox_inches='tight')
-    plt.close(fig)
-    gc.collect()
-    logging.info(f"Saved top models by range plot")
-
-    # Forecasted EV Market
-    fig, ax = plt.subplots(figsize=(8, 5))
-    ev_registration_counts = df['Model Year'].value_counts().sort_index()
-    filtered_years = ev_registration_counts[ev_registration_counts.index <= 2023]
-    years = np.arange(filtered_years.index.min(), 2029 + 1)
-    actual_years = filtered_years.index
-    forecast_years_full = np.arange(2024, 2029 + 1)
-    actual_values = filtered_years.values
-    forecasted_values_full = [forecasted_evs[year] for year in forecast_years_full]
+    _save_chart(fig, filename)
+
+def _plot_forecast(actual_years, actual_values, forecast_years, forecast_values, filename):
+    fig, ax = _reset_axes(8, 5)
     ax.plot(actual_years, actual_values, 'bo-', label='Actual Registrations')
-    ax.plot(forecast_years_full, forecasted_values_full, 'ro--', label='Forecasted Registrations')
+    ax.plot(forecast_years, forecast_values, 'ro--', label='Forecasted Registrations')
     ax.set_title('Current & Estimated EV Market')
     ax.set_xlabel('Year')
     ax.set_ylabel('Number of EV Registrations')
     ax.legend(loc='upper left')  # Legend inside, top-left
-    filename = f'{output_prefix}_ev_market_forecast_{timestamp}.png'
-    plt.savefig(filename, dpi=150, bbox_inches='tight')
-    plt.close(fig)
-    gc.collect()
-    logging.info(f"Saved EV market forecast plot")
+    _save_chart(fig, filename)
+
+def plot_all_charts(df, year_stats, forecasted_evs, output_prefix):
+    """Plot charts with matplotlib styling, rendering them in parallel worker processes."""
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
 
-def forecast_future_registrations(df):
+    # Precompute every aggregation serially so workers only receive small arrays, not the DataFrame
+    years, year_counts, year_mean_range = year_stats
+    top_county_codes, _ = top_k_categories(df['County'], 3)
+    top_counties = df['County'].cat.categories[top_county_codes]
+    top_counties_data = df.iloc[rows_with_codes(df['County'], top_county_codes)]
+    ev_type_distribution = df['Electric Vehicle Type'].value_counts()
+    top_make_codes, top_make_counts = top_k_categories(df['Make'], 5)
+    top_makes = df['Make'].cat.categories[top_make_codes]
+    top_3_makes = top_makes[:3]
+    top_makes_data = df.iloc[rows_with_codes(df['Make'], top_make_codes[:3])]
+    # Pair counts (and range sums) are 2-D histograms over the category codes: one flat bincount each
+    city_county_codes, city_codes, city_counts, _ = pair_stats(top_counties_data['County'], top_counties_data['City'])
+    top_cities = top_k(city_counts, 5)
+    model_make_codes, model_codes, model_counts, model_range_sums = pair_stats(
+        top_makes_data['Make'], top_makes_data['Model'], weights=top_makes_data['Electric Range'].to_numpy())
+    model_mean_range = (model_range_sums / model_counts).astype(np.float32)
+    top_models = top_k(model_counts, 5)
+    top_range_models = top_k(model_mean_range, 5)
+    counties = df['County'].cat.categories
+    cities = df['City'].cat.categories
+    makes = df['Make'].cat.categories
+    models = df['Model'].cat.categories
+    actual = years <= 2023
+    forecast_years_full = np.arange(2024, 2029 + 1)
+    forecasted_values_full = np.array([forecasted_evs[year] for year in forecast_years_full], dtype=np.float32)
+
+    def chart_path(name):
+        return f'{output_prefix}_{name}_{timestamp}.png'
+
+    charts = {
+        'EV adoption over time': (_plot_ev_adoption, years, year_counts, chart_path('ev_adoption_over_time')),
+        'top cities in top counties': (
+            _plot_grouped_barh, truncate12(cities[city_codes[top_cities]]), city_counts[top_cities],
+            counties[city_county_codes[top_cities]].astype(str).to_numpy(), len(top_counties), 'magma',
+            'Top Cities in Top Counties by EV Registrations', 'Number of Vehicles', 'City', 'County',
+            chart_path('top_cities_in_top_counties')),
+        'EV type distribution': (
+            _plot_barh, ev_type_distribution.index.astype(str).to_numpy(), ev_type_distribution.to_numpy(), 'magma',
+            'Distribution of Electric Vehicle Types', 'Number of Vehicles', 'Electric Vehicle Type',
+            chart_path('ev_type_distribution')),
+        'top 5 makes': (
+            _plot_barh, top_makes.astype(str).to_numpy(), top_make_counts, 'cubehelix',
+            'Top 5 Popular EV Makes', 'Number of Vehicles', 'Make', chart_path('top_5_makes')),
+        'top models in top makes': (
+            _plot_grouped_barh, truncate12(models[model_codes[top_models]]), model_counts[top_models],
+            makes[model_make_codes[top_models]].astype(str).to_numpy(), len(top_3_makes), 'viridis',
+            'Top Models in Top 3 Makes by EV Registrations', 'Number of Vehicles', 'Model', 'Make',
+            chart_path('top_models_in_top_makes')),
+        'average range by year': (_plot_average_range, years, year_mean_range, chart_path('average_range_by_year')),
+        'top models by range': (
+            _plot_grouped_barh, truncate12(models[model_codes[top_range_models]]), model_mean_range[top_range_models],
+            makes[model_make_codes[top_range_models]].astype(str).to_numpy(), len(top_3_makes), 'cool',
+            'Top 5 Models by Average Range in Top Makes', 'Average Electric Range (miles)', 'Model', 'Make',
+            chart_path('top_models_by_range')),
+        'EV market forecast': (
+            _plot_forecast, years[actual], year_counts[actual], forecast_years_full, forecasted_values_full,
+            chart_path('ev_market_forecast')),
+    }
+
+    # The charts are independent, so render each one in its own process when there is more than one CPU
+    max_workers = min(len(charts), os.cpu_count() or 1)
+    if max_workers == 1:
+        # A single worker gives no parallelism, only process start-up and argument pickling
+        for name, (plot, *args) in charts.items():
+            plot(*args)
+            logging.info(f"Saved {name} plot")
+        return
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(*args): name for name, args in charts.items()}
+        for future in as_completed(futures):
+            future.result()
+            logging.info(f"Saved {futures[future]} plot")
+
+def forecast_future_registrations(year_stats):
     """Forecast future EV registrations using exponential growth."""
-    ev_registration_counts = df['Model Year'].value_counts().sort_index()
-    filtered_years = ev_registration_counts[ev_registration_counts.index <= 2023]
+    years, year_counts, _ = year_stats
+    actual = years <= 2023
+    filtered_years = years[actual]
+
+    x_data = filtered_years - filtered_years.min()
+    y_data = year_counts[actual]
 
     def exp_growth(x, a, b):
         return a * np.exp(b * x)
 
-    x_data = filtered_years.index - filtered_years.index.min()
-    y_data = filtered_years.values
-
-    params, _ = curve_fit(exp_growth, x_data, y_data)
-    forecast_years = np.arange(2024, 2029 + 1) - filtered_years.index.min()
+    # log(a * exp(b * x)) = log(a) + b * x gives a closed-form starting point, so the nonlinear
+    # fit converges in a few iterations instead of searching from the default (1, 1)
+    b0, log_a0 = np.polyfit(x_data, np.log(y_data.astype(np.float64)), 1)
+    params, _ = curve_fit(exp_growth, x_data, y_data, p0=(np.exp(log_a0), b0))
+    forecast_years = np.arange(2024, 2029 + 1) - filtered_years.min()
     forecasted_values = exp_growth(forecast_years, *params)
-    forecasted_evs = dict(zip(forecast_years + filtered_years.index.min(), forecasted_values))
+    forecasted_evs = dict(zip(forecast_years + filtered_years.min(), forecasted_values))
 
     return forecasted_evs
 
 def main():
     """Main function to analyze and visualize EV registrations."""
-    setup_logging()
+    parser = argparse.ArgumentParser(description='Analyze and visualize EV registrations in Washington State.')
+    parser.add_argument('--verbose', action='store_true', help='print dataset preview, info and missing values (re-reads the CSV instead of the Parquet cache)')
+    args = parser.parse_args()
+    setup_logging(args.verbose)
 
     # Get the directory of the script and navigate to the parent directory
     script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -230,10 +446,12 @@ def main():
     df = load_data(file_path)
 
     if df is not None:
-        forecasted_evs = forecast_future_registrations(df)
+        year_codes, min_year = encode_model_years(df)
+        year_stats = aggregate_by_year(year_codes, min_year, df['Electric Range'].to_numpy(dtype=np.float32))
+        forecasted_evs = forecast_future_registrations(year_stats)
         print("\nForecasted EV Registrations (2024-2029):")
         print(forecasted_evs)
-        plot_all_charts(df, forecasted_evs, os.path.join(output_folder, os.path.basename(file_path).split(".")[0]))
+        plot_all_charts(df, year_stats, forecasted_evs, os.path.join(output_folder, os.path.basename(file_path).split(".")[0]))
 
 if __name__ == "__main__":
     main()
\ No newline at end of file